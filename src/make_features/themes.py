@@ -0,0 +1,125 @@
+import re
+from functools import lru_cache
+
+# Checked in order, the first matching theme wins
+THEME_REGEXES = [
+    (re.compile(r"self\s?(-|\s)\s?employ"), "self-employ"),
+    (re.compile(r"(deliver(y|(ies)|(ed)))|(slot)|(online shopping)"), "delivery"),
+    (re.compile(r"vulnerable"), "vulnerable"),
+    (re.compile(r"disab((led)|(ility))"), "disabled"),
+    (re.compile(r"no symptom"), "no-symptoms"),
+    (re.compile(r"((corona)?(virus))|(covid)"), "covid-mention"),
+    (re.compile(r"""((health)|(heart) (problem)|(issue)|(condition)|(attack)|(disease)|(failure))|( ms)|"""
+                r"""(copd)|(asthma)|((type)\s?[12])|(diabet)|"""
+                r"""(cancer)|(dementia)|(stroke)|(illness)|(a type$)|(cough)|(leukaemia)"""), "health-problem"),
+    (re.compile(r"symptom"), "symptoms"),
+    (re.compile(r"((at)?(\s(very\s)?high)?\srisk)|(risk list)"), "at-risk"),
+    (re.compile(r"""((((a|'|’)m( (in|at)( my)?)?)|aged) (over(-|\s))?"""
+                r"""(([789][0-9]($|s|\s))|(old)|(elderly)))|((over(-|\s))?[789][0-9] y)"""), "elderly"),
+    (re.compile(r"(carer)|(care home)"), "carer"),
+    (re.compile(r"(key\s?(\s|-)?\s?worker)|(nurse($|\s))|(essential worker)"), "key-worker"),
+    (re.compile(r"can\s?(no|'|’)?t work"), "cannot-work"),
+    (re.compile(r"no ((work)|(income)|(money)|(wage)|(salar))"), "no-income"),
+    (re.compile(r"(furlough)|(fired)|(80 %)"), "laid-off"),
+    (re.compile(r"""(((can\s?(no|'|’)?t (get|buy|(shop for)))|"""
+                r"""((do not)?ha(ve|d) )(no|any|(not enough))?) (food|groceries))"""), "cannot-get-food"),
+    (re.compile(r"can\s?(no|'|’)?t get ((med)|(prescription))"), "cannot-get-med"),
+    (re.compile(r"(^med)|(prescription)"), "get-med"),
+    (re.compile(r"(travel(\s(advi[sc]e)|(status))?)|(flight)|(destination)"), "travel"),
+    (re.compile(r"""(no\s)(\w*\s)?((info)|(clarification)|(advi[sc]e)|((contact )?((details)|(number)))|"""
+                r"""(answer)|(update)|(clarity)|(guid(e|(ance)))|(list)|(definition)|"""
+                r"""(address)|(link)|(form)|(contact)|(mention))"""), "no-information"),
+    (re.compile(r"""(info)|(clarification)|(advi[sc]e)|((contact )?((details)|(number)))|"""
+                r"""(answer)|(update)|(clarity)|(guid(e|(ance)))|(list)|(definition)|"""
+                r"""(address)|(link)|(form)|(contact)"""), "information"),
+    (re.compile(r"""(no)\s((letter)|(t(e)?xt)|(message)|(e(\s|(\s?-\s?))?mail)|"""
+                r"""(alert)|(notice)|(communication))"""), "no-correspondence"),
+    (re.compile(r"(letter)|(t(e)?xt)|(message)|(e(\s|(\s?-\s?))?mail)|(alert)|(notice)"), "correspondence"),
+    (re.compile(r"(no\s?((family)|(one)))|(nothing)|(nobody)"), "no-one"),
+    (re.compile(r"no ((support)|(aid)|(help)|(assistance)|(access)|(priority))"), "no-support"),
+    (re.compile(r"(support)|(aid)|(help)|(assistance)|(access)|(priority)"), "support"),
+    (re.compile(r"(child)|((^|\s)son)|(daughter)"), "child"),
+    (re.compile(r"""(parent)|(husband)|(wife)|(partner)|"""
+                r"""((mo|fa)ther)|(famil(y|(ies)))|(m[uo]m)|(dad)"""), "family"),
+    (re.compile(r"(rule)|(restriction)|(measure)|(rights)"), "rules"),
+    (re.compile(r"((no)|(a(ny)?)) ((way)|(option)|(choice)|(means)|(idea))"), "uncertainty"),
+    (re.compile(r"work ((for)|(in)|(at)|(on))"), "work"),
+    (re.compile(r"((self\s|-)?isolat((ion)|(e)|(ing)))|(lock\s?(\s|-)?\s?down)"), "self-isolation"),
+    (re.compile(r"(driv(ing|ers)\s)?licen[sc]e"), "license"),
+    (re.compile(r"passport"), "passport"),
+    (re.compile(r"pension"), "pension"),
+    (re.compile(r"(^|\s)h((ome)|(ouse))"), "home-mention"),
+    (re.compile(r"(employ)|(work)|(job)|(business)|(company)"), "work-mention"),
+    (re.compile(r"(benefit)|(universal credit)|(eligible)|(esa)|(ssp)|(pip)|(allowance)"), "benefit"),
+    (re.compile(r"(school)|(student)"), "school"),
+    (re.compile(r"(food)|(supplies)|(shopping)|(groceries)"), "goods"),
+    (re.compile(r"(money)|(grant)|(fund)|(relief)"), "given-money"),
+    (re.compile(r"(bill)|(tax)|(mortgage)|(rent)|(loan)|(debt)|(fine)|(fee)|(insurance)"), "bills-to-pay"),
+    (re.compile(r"scheme"), "scheme"),
+    (re.compile(r"(^|\s)visa($|\s)"), "visa"),
+    (re.compile(r"(data)|(cases)|(situation)|(stat(istic)?s?$)|(status)|(news)|(progress)"), "data"),
+    (re.compile(r"dea((th)|d)"), "death"),
+]
+
+# Checked in order, the first matching group wins
+VERB_REGEXES = [
+    (re.compile(r"""(f(i|(ou))nd)|(look)|(search)|(clarify)|(ask)|(read)|([ei]nquire)|"""
+                r"""(obtain)|(seek)|(know)|((^|\s)see($|\s))|(understand)"""), "find-smthg"),
+    (re.compile(r"(access)|(check)|(complete)|(cancel)|(book)|(confirm)"), "access-smthg"),
+    (re.compile(r"(get)|(take)|(claim)|(receive)|(sent)|(collect)"), "acquire-smthg"),
+    (re.compile(r"(renew)|(change)|(update)|(inform$)|(notify)"), "change-smthg"),
+    (re.compile(r"(appl(y|(ied)))|(register)|(qualify)|(sign)"), "apply-smthg"),
+    (re.compile(r"pa(y|(id)|(yed))"), "pay-smthg"),
+    (re.compile(r"(contact)|(report)"), "contact-smthg"),
+    (re.compile(r"(work)|(employ)"), "work-smwhr"),
+    (re.compile(r"(need)|(want)|(require)|(request)|(would like)|(order)"), "need-smthg"),
+    (re.compile(r"(have)|((a|'|’|^)m($|\s))|(feel($|\s))"), "my-situation"),
+    (re.compile(r"(has)|(((a|we)|'|’|^)re($|\s))"), "others-situation"),
+    (re.compile(r"(had)|((i|'|’|^)s($|\s))|(was)"), "unclear-situation"),
+    (re.compile(r"travel"), "travel"),
+    (re.compile(r"(liv(e|(ing)))|(stay)"), "living"),
+    (re.compile(r"(do)|(make)"), "do-smthng"),
+    (re.compile(r"go($|\s)"), "go-smwhr"),
+    (re.compile(r"(give)|(provide)"), "give-smthng"),
+    (re.compile(r"(help)|(protect)|(support)"), "help"),
+]
+
+
+@lru_cache(maxsize=100000)
+def regex_for_theme(text):
+    """Return the theme of a noun phrase, or "unknown" if no theme regex matches
+
+    >>> regex_for_theme("Universal Credit")
+    'benefit'
+    >>> regex_for_theme("stats")
+    'data'
+    >>> regex_for_theme("the weather")
+    'unknown'
+    """
+    text = text.lower()
+    for regex, theme in THEME_REGEXES:
+        if regex.search(text):
+            return theme
+    return "unknown"
+
+
+@lru_cache(maxsize=100000)
+def regex_group_verbs(verb):
+    """Return the group of a lower case verb phrase, or "unknown" if no verb regex matches
+
+    >>> regex_group_verbs("apply for")
+    'apply-smthg'
+    >>> regex_group_verbs("find out")
+    'find-smthg'
+    >>> regex_group_verbs("sneeze")
+    'unknown'
+    """
+    for regex, group in VERB_REGEXES:
+        if regex.search(verb):
+            return group
+    return "unknown"
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()